@@ -1,6 +1,7 @@
 from .tensor import *
 from .ops import *
 from deeplib import (
+    config as config,
     nn as nn,
     optim as optim,
     utils as utils
@@ -8,4 +9,4 @@ from deeplib import (
 
 __version__ = "0.0.3"
 
-__all__ = ["tensor", "ops", "nn", "optim", "utils"]
+__all__ = ["tensor", "ops", "config", "nn", "optim", "utils"]
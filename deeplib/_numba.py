@@ -0,0 +1,83 @@
+from deeplib import config
+
+__all__ = ["mul_accumulate", "div_accumulate", "pow_accumulate"]
+
+# above this size NumPy's per-call overhead no longer dominates
+_MAX_SIZE = 1000
+
+# compiled kernels, built on first use so numba is only imported once
+# config.numba_backend is switched on; False if numba is not installed
+_kernels = None
+
+
+def _load_kernels():
+    global _kernels
+    if _kernels is not None:
+        return _kernels
+    try:
+        from numba import njit
+    except ImportError:
+        _kernels = False
+        return _kernels
+
+    # error_model="numpy" and no fastmath, so zero divisors, inf and nan
+    # behave exactly as in the NumPy fallback; these elementwise loops
+    # vectorize without fastmath
+    @njit(error_model="numpy", cache=True)
+    def mul_acc(grad, a, b, scale):
+        for i in range(grad.size):
+            grad[i] += scale * a[i] * b[i]
+
+    @njit(error_model="numpy", cache=True)
+    def div_acc(grad, a, b):
+        for i in range(grad.size):
+            grad[i] += a[i] / b[i]
+
+    @njit(error_model="numpy", cache=True)
+    def pow_acc(grad, out_grad, x, power):
+        for i in range(grad.size):
+            grad[i] += out_grad[i] * power * x[i] ** (power - 1)
+
+    _kernels = {"mul": mul_acc, "div": div_acc, "pow": pow_acc}
+    return _kernels
+
+
+def _fusable(tensor, *arrays):
+    # the kernels add straight into an existing, contiguous grad buffer of the
+    # same shape; first accumulations and parallel backward use the NumPy path
+    if not config.numba_backend:
+        return False
+    grad = tensor.grad
+    if grad is None or tensor._grad_lock is not None or grad.size >= _MAX_SIZE:
+        return False
+    if not (grad.flags.c_contiguous and all(
+        a.shape == grad.shape and a.flags.c_contiguous for a in arrays
+    )):
+        return False
+    return bool(_load_kernels())
+
+
+def mul_accumulate(tensor, a, b, scale=1.0):
+    """tensor.grad += scale * a * b in one compiled loop, if applicable."""
+    if not _fusable(tensor, a, b):
+        return False
+    _kernels["mul"](tensor.grad.reshape(-1), a.reshape(-1), b.reshape(-1), scale)
+    return True
+
+
+def div_accumulate(tensor, a, b):
+    """tensor.grad += a / b in one compiled loop, if applicable."""
+    if not _fusable(tensor, a, b):
+        return False
+    _kernels["div"](tensor.grad.reshape(-1), a.reshape(-1), b.reshape(-1))
+    return True
+
+
+def pow_accumulate(tensor, out_grad, x, power):
+    """tensor.grad += out_grad * power * x ** (power - 1), if applicable."""
+    if not _fusable(tensor, out_grad, x):
+        return False
+    # a float exponent goes through pow(), which yields inf on a zero base
+    # like NumPy; numba's integer power path raises ZeroDivisionError instead
+    _kernels["pow"](tensor.grad.reshape(-1), out_grad.reshape(-1), x.reshape(-1), float(power))
+    return True
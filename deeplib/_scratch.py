@@ -0,0 +1,55 @@
+import threading
+import numpy as np
+
+__all__ = ["borrow", "release", "clear"]
+
+# upper bound on pooled buffers per thread; varying batch sizes would
+# otherwise leave one buffer behind for every shape ever seen
+_MAX_BUFFERS = 16
+
+# per-thread pool of reusable temporaries for backward closures,
+# keyed by (shape, dtype) and ordered from least to most recently released
+_local = threading.local()
+
+
+def _pool():
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = {}
+        _local.size = 0
+    return pool
+
+
+def borrow(shape, dtype=np.float32):
+    pool = _pool()
+    key = (shape, np.dtype(dtype))
+    buffers = pool.get(key)
+    if buffers:
+        _local.size -= 1
+        buffer = buffers.pop()
+        if not buffers:
+            del pool[key]
+        return buffer
+    return np.empty(shape, dtype=dtype)
+
+
+def release(buffer):
+    pool = _pool()
+    key = (buffer.shape, buffer.dtype)
+    buffers = pool.pop(key, [])
+    buffers.append(buffer)
+    pool[key] = buffers
+    _local.size += 1
+
+    # evict from the least recently used shapes first
+    while _local.size > _MAX_BUFFERS:
+        oldest = next(iter(pool))
+        pool[oldest].pop(0)
+        if not pool[oldest]:
+            del pool[oldest]
+        _local.size -= 1
+
+
+def clear():
+    _pool().clear()
+    _local.size = 0
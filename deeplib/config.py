@@ -0,0 +1,4 @@
+# Run the elementwise gradient accumulations of small tensors through
+# Numba-compiled loops. Requires the optional `numba` package; without it
+# the flag has no effect and the NumPy path is used.
+numba_backend = False
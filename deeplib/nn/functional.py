@@ -13,29 +13,46 @@ def dropout(input: Tensor, p: float = 0.5, training: bool = True) -> Tensor:
 
 def relu(input: Tensor) -> Tensor:
     out = Tensor(np.maximum(0, input.data), _children=(input,), requires_grad=input.requires_grad)
+
+    if not out.requires_grad:
+        return out
     
     def _backward():
         if input.requires_grad:
-            input.grad += out.grad * (input.data > 0)
+            input._accumulate_grad(out.grad * (input.data > 0))
 
     out._backward = _backward
     return out
 
 def tanh(X: Tensor) -> Tensor:
     out = Tensor(np.tanh(X.data), _children=(X,), requires_grad=X.requires_grad)
+
+    if not out.requires_grad:
+        return out
     
     def _backward():
         if X.requires_grad:
-            X.grad += out.grad * (1 - out.data**2)
+            # 1 - tanh^2, built in a single scratch array
+            grad = np.square(out.data)
+            grad *= -1
+            grad += 1
+            grad *= out.grad
+            X._accumulate_grad(grad)
             
     out._backward = _backward
     return out
 
 def sigmoid(input: Tensor) -> Tensor:
     out = Tensor(1 / (1 + np.exp(-input.data)), _children=(input,), requires_grad=input.requires_grad)
+
+    if not out.requires_grad:
+        return out
     def _backward():
         if input.requires_grad:
-            input.grad += out.grad * out.data * (1 - out.data)
+            grad = 1 - out.data
+            grad *= out.data
+            grad *= out.grad
+            input._accumulate_grad(grad)
     out._backward = _backward
     return out
 
@@ -8,11 +8,14 @@ def getitem(X, key):
     sliced_data = X.data[key]
     out = Tensor(sliced_data, _children=(X,), requires_grad=X.requires_grad)
 
+    if not out.requires_grad:
+        return out
+
     def _backward():
         if X.requires_grad:
             grad = np.zeros_like(X.data)
             grad[key] = out.grad
-            X.grad += grad
+            X._accumulate_grad(grad)
 
     out._backward = _backward
     return out
@@ -34,11 +37,21 @@ def gather(X, dim, index):
 
     out = Tensor(gathered_data, _children=(X,), requires_grad=X.requires_grad)
 
+    if not out.requires_grad:
+        return out
+
+    # without repeated indices a plain scatter is enough, and much cheaper than np.add.at
+    # (negative indices are normalized first, -1 and size - 1 hit the same slot)
+    unique = np.unique(index.data % X.shape[dim]).size == index.data.size
+
     def _backward():
         if X.requires_grad:
             grad = np.zeros_like(X.data)
-            np.add.at(grad, tuple(slices), out.grad)
-            X.grad += grad
+            if unique:
+                grad[tuple(slices)] = out.grad
+            else:
+                np.add.at(grad, tuple(slices), out.grad)
+            X._accumulate_grad(grad)
 
     out._backward = _backward
     return out
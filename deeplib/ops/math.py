@@ -1,5 +1,7 @@
 import numpy as np
-from deeplib.tensor import Tensor
+from deeplib.tensor import NoGrad, Tensor
+from deeplib._scratch import borrow, release
+from deeplib import _numba
 
 __all__ = [
     "add",
@@ -7,6 +9,8 @@ __all__ = [
     "mul",
     "true_divide",
     "pow",
+    "square",
+    "reciprocal",
     "neg",
     "sum",
     "mean",
@@ -19,6 +23,21 @@ __all__ = [
 ]
 
 
+def _broadcast_axes(shape, out_shape):
+    """Axes of `out_shape` that were produced by broadcasting `shape`."""
+    extra = len(out_shape) - len(shape)
+    return tuple(range(extra)) + tuple(
+        i + extra
+        for i, dim in enumerate(shape)
+        if dim == 1 and out_shape[i + extra] != 1
+    )
+
+def _unbroadcast(grad, shape, axes):
+    """Sum `grad` over the broadcasted `axes` back down to `shape`."""
+    if not axes:
+        return grad
+    return np.add.reduce(grad, axis=axes).reshape(shape)
+
 def add(tensor1, tensor2):
     tensor2 = tensor2 if isinstance(tensor2, Tensor) else Tensor(tensor2)
     
@@ -28,29 +47,53 @@ def add(tensor1, tensor2):
         requires_grad=tensor1.requires_grad or tensor2.requires_grad,
     )
 
+    if not out.requires_grad:
+        return out
+
+    # broadcasted axes are resolved once here, not on every backward call
+    axes1 = _broadcast_axes(tensor1.shape, out.shape)
+    axes2 = _broadcast_axes(tensor2.shape, out.shape)
+
     def _backward():
         if tensor1.requires_grad:
-            grad = out.grad
-            # sum over all broadcasted axes
-            while grad.ndim > tensor1.grad.ndim:
-                grad = grad.sum(axis=0)
-            for i, dim in enumerate(tensor1.grad.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
-            tensor1.grad = tensor1.grad + grad
+            tensor1._accumulate_grad(_unbroadcast(out.grad, tensor1.shape, axes1))
         if tensor2.requires_grad:
-            grad = out.grad
-            # sum over all broadcasted axes
-            while grad.ndim > tensor2.grad.ndim:
-                grad = grad.sum(axis=0)
-            for i, dim in enumerate(tensor2.grad.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
-            tensor2.grad = tensor2.grad + grad
+            tensor2._accumulate_grad(_unbroadcast(out.grad, tensor2.shape, axes2))
 
     out._backward = _backward
     return out
 
+def _contraction_spec(shape, other_shape, out_shape):
+    """
+    Describe the gradient of one operand of a broadcasting mul as a single
+    contraction of `out.grad` with the other operand, so backward never
+    materializes the full-size `other * out.grad` product before reducing it.
+    Returns None when `shape` was not broadcast.
+    """
+    axes = _broadcast_axes(shape, out_shape)
+    if not axes:
+        return None
+    letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    padded = (1,) * (len(out_shape) - len(other_shape)) + tuple(other_shape)
+    # size-1 axes of the other operand are dropped instead of broadcast
+    other_axes = [i for i, dim in enumerate(padded) if dim != 1]
+    subscripts = "{},{}->{}".format(
+        letters[: len(out_shape)],
+        "".join(letters[i] for i in other_axes),
+        "".join(letters[i] for i in range(len(out_shape)) if i not in axes),
+    )
+    return subscripts, tuple(padded[i] for i in other_axes)
+
+def _fused_dot_bwd(grad, other, spec):
+    subscripts, other_shape = spec
+    other = other.reshape(other_shape)
+    # outer-product style broadcasts reduce to a matrix-vector product (BLAS)
+    if subscripts == "ab,b->a":
+        return grad @ other
+    if subscripts == "ab,a->b":
+        return other @ grad
+    return np.einsum(subscripts, grad, other)
+
 def mul(tensor1, tensor2):
     tensor2 = tensor2 if isinstance(tensor2, Tensor) else Tensor(tensor2)
     
@@ -58,60 +101,162 @@ def mul(tensor1, tensor2):
                  _children=(tensor1, tensor2),
                  requires_grad=tensor1.requires_grad or tensor2.requires_grad)
 
+    if not out.requires_grad:
+        return out
+    
+    # broadcast operands get their gradient from one fused contraction
+    spec1 = spec2 = None
+    if tensor1.requires_grad:
+        spec1 = _contraction_spec(tensor1.shape, tensor2.shape, out.shape)
+    if tensor2.requires_grad:
+        spec2 = _contraction_spec(tensor2.shape, tensor1.shape, out.shape)
+
     def _backward():
         if tensor1.requires_grad:
-            grad = tensor2.data * out.grad
-            # sum over all broadcasted axes
-            while grad.ndim > tensor1.grad.ndim:
-                grad = grad.sum(axis=0)
-            for i, dim in enumerate(tensor1.grad.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
-            tensor1.grad = tensor1.grad + grad
+            if spec1 is None:
+                if not _numba.mul_accumulate(tensor1, tensor2.data, out.grad):
+                    grad = borrow(tensor1.shape, tensor1.dtype)
+                    np.multiply(tensor2.data, out.grad, out=grad)
+                    tensor1._accumulate_grad(grad)
+                    release(grad)
+            else:
+                grad = _fused_dot_bwd(out.grad, tensor2.data, spec1).reshape(tensor1.shape)
+                tensor1._accumulate_grad(grad)
 
         if tensor2.requires_grad:
-            grad = tensor1.data * out.grad
-            # sum over all broadcasted axes
-            while grad.ndim > tensor2.grad.ndim:
-                grad = grad.sum(axis=0)
-            for i, dim in enumerate(tensor2.grad.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
-            tensor2.grad = tensor2.grad + grad
+            if spec2 is None:
+                if not _numba.mul_accumulate(tensor2, tensor1.data, out.grad):
+                    grad = borrow(tensor2.shape, tensor2.dtype)
+                    np.multiply(tensor1.data, out.grad, out=grad)
+                    tensor2._accumulate_grad(grad)
+                    release(grad)
+            else:
+                grad = _fused_dot_bwd(out.grad, tensor1.data, spec2).reshape(tensor2.shape)
+                tensor2._accumulate_grad(grad)
 
     out._backward = _backward
     return out
     
+def _blas_ready(data):
+    # np.matmul only hands C- or F-contiguous matrices to BLAS (a transposed
+    # view of either is fine); anything else falls back to a naive loop
+    if data.flags.c_contiguous or data.flags.f_contiguous:
+        return data
+    return np.ascontiguousarray(data)
+
 def matmul(tensor1, tensor2):
-    out = Tensor(tensor1.data @ tensor2.data,
+    a = _blas_ready(tensor1.data)
+    b = _blas_ready(tensor2.data)
+    out = Tensor(a @ b,
                  _children=(tensor1, tensor2),
                  requires_grad=tensor1.requires_grad or tensor2.requires_grad)
+
+    if not out.requires_grad:
+        return out
     
     def _backward():
+        grad = _blas_ready(out.grad)
         if tensor1.requires_grad:
-            tensor1.grad += out.grad @ tensor2.data.T
+            tensor1._accumulate_grad(grad @ b.T)
         if tensor2.requires_grad:
-            tensor2.grad += tensor1.data.T @ out.grad
+            tensor2._accumulate_grad(a.T @ grad)
         
     out._backward = _backward
     return out
 
 def pow(tensor, power):
     assert isinstance(power, (int, float))
+
+    # common exponents get dedicated kernels instead of the generic np.power path
+    if power == 2:
+        return square(tensor)
+    if power == 0.5:
+        return sqrt(tensor)
+    if power == -1:
+        return reciprocal(tensor)
     
     out = Tensor(tensor.data**power,
                  _children=(tensor,),
                  requires_grad=tensor.requires_grad)
 
+    if not out.requires_grad:
+        return out
+
     def _backward():
-        if tensor.requires_grad:
-            tensor.grad += out.grad * power * tensor.data ** (power - 1)
+        if tensor.requires_grad and not _numba.pow_accumulate(tensor, out.grad, tensor.data, power):
+            # power * x ** (power - 1) * out.grad, built in one scratch buffer
+            grad = borrow(tensor.shape, tensor.dtype)
+            if power == 3:
+                np.square(tensor.data, out=grad)
+            else:
+                np.power(tensor.data, power - 1, out=grad)
+            grad *= out.grad
+            grad *= power
+            tensor._accumulate_grad(grad)
+            release(grad)
+
+    out._backward = _backward
+    return out
+
+def square(tensor):
+    out = Tensor(np.square(tensor.data),
+                 _children=(tensor,),
+                 requires_grad=tensor.requires_grad)
+
+    if not out.requires_grad:
+        return out
+
+    def _backward():
+        if tensor.requires_grad and not _numba.mul_accumulate(tensor, out.grad, tensor.data, 2.0):
+            grad = borrow(tensor.shape, tensor.dtype)
+            np.multiply(out.grad, tensor.data, out=grad)
+            grad *= 2
+            tensor._accumulate_grad(grad)
+            release(grad)
 
     out._backward = _backward
     return out
 
 def sqrt(tensor):
-    return pow(tensor, 0.5)
+    out = Tensor(np.sqrt(tensor.data),
+                 _children=(tensor,),
+                 requires_grad=tensor.requires_grad)
+
+    if not out.requires_grad:
+        return out
+
+    def _backward():
+        if tensor.requires_grad:
+            # 0.5 / sqrt(x), reusing the forward result
+            grad = borrow(tensor.shape, tensor.dtype)
+            np.divide(out.grad, out.data, out=grad)
+            grad *= 0.5
+            tensor._accumulate_grad(grad)
+            release(grad)
+
+    out._backward = _backward
+    return out
+
+def reciprocal(tensor):
+    out = Tensor(np.reciprocal(tensor.data),
+                 _children=(tensor,),
+                 requires_grad=tensor.requires_grad)
+
+    if not out.requires_grad:
+        return out
+
+    def _backward():
+        if tensor.requires_grad:
+            # -1 / x^2 == -(1 / x)^2, reusing the forward result
+            grad = borrow(tensor.shape, tensor.dtype)
+            np.multiply(out.grad, out.data, out=grad)
+            grad *= out.data
+            np.negative(grad, out=grad)
+            tensor._accumulate_grad(grad)
+            release(grad)
+
+    out._backward = _backward
+    return out
 
 def neg(tensor):
     return tensor*-1
@@ -120,25 +265,86 @@ def sub(tensor1, tensor2):
     return add(tensor1, neg(tensor2))
 
 def true_divide(tensor1, tensor2):
-    return mul(tensor1, tensor2**-1)
+    if isinstance(tensor2, (int, float)):
+        # multiplying by the reciprocal is cheaper than dividing
+        return mul(tensor1, 1.0 / tensor2)
+    tensor2 = tensor2 if isinstance(tensor2, Tensor) else Tensor(tensor2)
 
+    out = Tensor(tensor1.data / tensor2.data,
+                 _children=(tensor1, tensor2),
+                 requires_grad=tensor1.requires_grad or tensor2.requires_grad)
+
+    if not out.requires_grad:
+        return out
 
-def exp(tensor):
-    out = Tensor(np.exp(tensor.data), _children=(tensor,), requires_grad=tensor.requires_grad)
+    axes1 = _broadcast_axes(tensor1.shape, out.shape)
+    axes2 = _broadcast_axes(tensor2.shape, out.shape)
 
     def _backward():
-        if tensor.requires_grad:
-            tensor.grad += out.grad * out.data
+        if tensor1.requires_grad:
+            grad = out.grad / tensor2.data
+            tensor1._accumulate_grad(_unbroadcast(grad, tensor1.shape, axes1))
+        if tensor2.requires_grad:
+            # d(a / b)/db = -(a / b) / b, reusing the forward result
+            grad = out.grad * out.data
+            grad /= tensor2.data
+            grad *= -1
+            tensor2._accumulate_grad(_unbroadcast(grad, tensor2.shape, axes2))
 
     out._backward = _backward
     return out
 
-def log(X):
-    out = Tensor(np.log(X.data), _children=(X,), requires_grad=X.requires_grad)
+
+def _as_float32(data):
+    # NumPy ships AVX2/AVX-512 vectorized exp/log loops for float32 (>=1.17);
+    # other dtypes may fall back to scalar libm calls
+    return data if data.dtype == np.float32 else data.astype(np.float32)
+
+def _out_buffer(name, out, tensor):
+    # backward reads the result (exp) or the input (log) later, so the graph
+    # must not be built on a buffer the caller may overwrite
+    if out is None:
+        return None
+    if tensor.requires_grad and not NoGrad._enabled:
+        raise RuntimeError(
+            f"{name}(): out= is not supported for tensors that require gradients."
+        )
+    return out.data if isinstance(out, Tensor) else out
+
+def exp(tensor, out=None):
+    buffer = _out_buffer("exp", out, tensor)
+    out = Tensor(np.exp(_as_float32(tensor.data), out=buffer),
+                 _children=(tensor,),
+                 requires_grad=tensor.requires_grad)
+
+    if not out.requires_grad:
+        return out
 
     def _backward():
-        if X.requires_grad:
-            X.grad += out.grad / X.data
+        if tensor.requires_grad and not _numba.mul_accumulate(tensor, out.grad, out.data):
+            grad = borrow(tensor.shape, tensor.dtype)
+            np.multiply(out.grad, out.data, out=grad)
+            tensor._accumulate_grad(grad)
+            release(grad)
+
+    out._backward = _backward
+    return out
+
+def log(X, out=None):
+    buffer = _out_buffer("log", out, X)
+    out = Tensor(np.log(_as_float32(X.data), out=buffer),
+                 _children=(X,),
+                 requires_grad=X.requires_grad)
+
+    if not out.requires_grad:
+        return out
+
+    def _backward():
+        if X.requires_grad and not _numba.div_accumulate(X, out.grad, X.data):
+            grad = borrow(X.shape, X.dtype)
+            np.divide(out.grad, X.data, out=grad)
+            X._accumulate_grad(grad)
+            release(grad)
 
     out._backward = _backward
     return out
@@ -150,18 +356,18 @@ def sum(X, dim=None, keepdims=False):
         _children=(X,),
         requires_grad=X.requires_grad,
     )
+
+    if not out.requires_grad:
+        return out
     
     def _backward():
         if X.requires_grad:
             grad = out.grad
-            # if axis is None, the gradient is scalar and should be broadcasted to the original shape
-            if dim is None:
-                grad = np.ones_like(X.data) * grad
-            else:
-                if not keepdims:
-                    grad = np.expand_dims(grad, axis=dim)
-                grad = np.broadcast_to(grad, X.shape)
-            X.grad += grad
+            if dim is not None and not keepdims:
+                grad = np.expand_dims(grad, axis=dim)
+            # zero-stride view: the expansion happens inside the accumulating
+            # add/copy instead of in a materialized full-size temporary
+            X._accumulate_grad(np.broadcast_to(grad, X.shape))
             
     out._backward = _backward
     return out
@@ -172,24 +378,74 @@ def mean(X, dim=None, keepdims=False):
     return sum(X, dim=dim, keepdims=keepdims) / n
     
 def var(X, dim=None, keepdims=False, unbiased=False):
-    tensor_mean = mean(X, dim=dim, keepdims=keepdims)
-    squared_diff = (X - tensor_mean) ** 2
-    
     n = X.data.size if dim is None else X.data.shape[dim]
-    if unbiased:
-        return sum(squared_diff, dim=dim, keepdims=keepdims) / (n - 1)
-    return sum(squared_diff, dim=dim, keepdims=keepdims) / n
+    count = n - 1 if unbiased else n
 
-def max(X, dim=None, keepdims=False):
+    # single fused node: deviations are computed once and reused by backward
+    diff = X.data - X.data.mean(axis=dim, keepdims=True)
     out = Tensor(
-        np.max(X.data, axis=dim, keepdims=keepdims),
+        np.add.reduce(np.square(diff), axis=dim, keepdims=keepdims) / count,
         _children=(X,),
         requires_grad=X.requires_grad,
     )
+
+    if not out.requires_grad:
+        return out
+
+    def _backward():
+        if X.requires_grad:
+            grad = out.grad
+            if dim is not None and not keepdims:
+                grad = np.expand_dims(grad, axis=dim)
+            # d/dx sum((x - m)^2) = 2 * (x - m), the mean term cancels out
+            X._accumulate_grad((grad * (2.0 / count)) * diff)
+
+    out._backward = _backward
+    return out
+
+def max(X, dim=None, keepdims=False):
+    # remember where the maximum was so backward can scatter straight into it
+    if dim is None:
+        index = np.unravel_index(np.argmax(X.data), X.data.shape)
+        data = X.data[index]
+        if keepdims:
+            data = np.reshape(data, (1,) * X.data.ndim)
+    elif isinstance(dim, tuple):
+        # move the reduced axes to the end and flatten them into a single one
+        axes = tuple(sorted(d % X.data.ndim for d in dim))
+        order = tuple(d for d in range(X.data.ndim) if d not in axes) + axes
+        moved_shape = tuple(X.shape[d] for d in order)
+        flat = np.transpose(X.data, order).reshape(moved_shape[: -len(axes)] + (-1,))
+        index = np.argmax(flat, axis=-1)[..., None]
+        data = np.take_along_axis(flat, index, axis=-1)[..., 0]
+        if keepdims:
+            data = np.expand_dims(data, axis=axes)
+    else:
+        index = np.expand_dims(np.argmax(X.data, axis=dim), axis=dim)
+        data = np.take_along_axis(X.data, index, axis=dim)
+        if not keepdims:
+            data = np.squeeze(data, axis=dim)
+
+    out = Tensor(data, _children=(X,), requires_grad=X.requires_grad)
+
+    if not out.requires_grad:
+        return out
     
     def _backward():
         if X.requires_grad:
-            X.grad += out.grad * (X.data == out.data)
+            if dim is None:
+                grad = np.zeros_like(X.data)
+                grad[index] = out.grad.reshape(())
+            elif isinstance(dim, tuple):
+                g = np.squeeze(out.grad, axis=axes) if keepdims else out.grad
+                flat_grad = np.zeros(flat.shape, dtype=X.data.dtype)
+                np.put_along_axis(flat_grad, index, np.expand_dims(g, axis=-1), axis=-1)
+                grad = np.transpose(flat_grad.reshape(moved_shape), np.argsort(order))
+            else:
+                grad = np.zeros_like(X.data)
+                g = out.grad if keepdims else np.expand_dims(out.grad, axis=dim)
+                np.put_along_axis(grad, index, g, axis=dim)
+            X._accumulate_grad(grad)
             
     out._backward = _backward
     return out
@@ -209,7 +465,9 @@ Tensor.__rmul__ = mul
 Tensor.__truediv__ = true_divide
 Tensor.__matmul__ = matmul
 Tensor.__pow__ = pow
+Tensor.square = square
 Tensor.sqrt = sqrt
+Tensor.reciprocal = reciprocal
         
 Tensor.exp = exp
 Tensor.log = log
@@ -1,3 +1,7 @@
+import os
+import threading
+from concurrent import futures
+
 import numpy as np
 
 class NoGrad:
@@ -16,6 +20,9 @@ def no_grad():
 
 
 class Tensor:
+    _cached_topo = None
+    _grad_lock = None
+
     def __init__(self, data, _children=(), requires_grad=False, dtype=None):
         if isinstance(data, Tensor):
             data = data.data
@@ -26,32 +33,111 @@ class Tensor:
         self.dtype = self.data.dtype
 
         self.requires_grad = requires_grad and not NoGrad._enabled
-        self.grad = np.zeros_like(self.data) if self.requires_grad else None
-        self._backward = lambda: None
-        self._children = set(_children)
-        self._id = id(self)
+        self.grad = None
+        # graph bookkeeping is only needed on tensors backward can reach
+        self._backward = None
+        if self.requires_grad:
+            self._children = _children if isinstance(_children, tuple) else tuple(_children)
+        else:
+            self._children = ()
             
-    def backward(self) -> None:
+    def backward(self, retain_topo=False, parallel=False) -> None:
         if not self.requires_grad:
             raise RuntimeError(
                 "Cannot call backward() on a tensor that does not require gradients."
             )
+
+        # the graph below a node never changes, so its order can be reused
+        # across repeated backward() calls on the same root
+        if retain_topo and self._cached_topo is not None:
+            topo = self._cached_topo
+        else:
+            topo = self._build_topo()
+            self._cached_topo = topo if retain_topo else None
+
+        # intermediate grads may still hold a previous pass over this graph;
+        # only leaves accumulate across backward() calls
+        for node in topo:
+            if node._backward is not None:
+                node.grad = None
         self.grad = np.ones_like(self.data)
 
+        if parallel:
+            self._backward_parallel(topo)
+        else:
+            for node in reversed(topo):
+                if node._backward is not None:
+                    node._backward()
+
+    def release_topo(self) -> None:
+        # drop the order cached by backward(retain_topo=True), which keeps
+        # the whole graph and its activations alive
+        self._cached_topo = None
+
+    def _backward_parallel(self, topo):
+        # run each node's _backward on a thread pool as soon as every node that
+        # feeds gradient into it has finished; NumPy releases the GIL for most
+        # kernels, so independent branches of the graph overlap
+        if self._backward is None:
+            return
+
+        pending = {id(node): 0 for node in topo}
+        for node in topo:
+            node._grad_lock = threading.Lock()
+            for child in node._children:
+                pending[id(child)] += 1
+
+        try:
+            with futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                running = {pool.submit(self._backward): self}
+                while running:
+                    done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        node = running.pop(future)
+                        future.result()
+                        for child in node._children:
+                            pending[id(child)] -= 1
+                            if pending[id(child)] == 0 and child._backward is not None:
+                                running[pool.submit(child._backward)] = child
+        finally:
+            for node in topo:
+                del node._grad_lock
+
+    def _accumulate_grad(self, grad):
+        # sibling nodes may write into the same grad during a parallel backward
+        if self._grad_lock is not None:
+            with self._grad_lock:
+                self._add_grad(grad)
+        else:
+            self._add_grad(grad)
+
+    def _add_grad(self, grad):
+        # gradients are allocated lazily on first accumulation; the incoming
+        # array is copied since it may alias another node's grad
+        if self.grad is None:
+            self.grad = np.empty_like(self.data)
+            np.copyto(self.grad, grad)
+        else:
+            np.add(self.grad, grad, out=self.grad)
+
+    def _build_topo(self):
+        # iterative post-order DFS, so deep graphs don't hit the recursion limit
         topo = []
         visited = set()
-
-        def build_topo(v):
-            if v not in visited:
-                visited.add(v)
-                for child in v._children:
-                    build_topo(child)
+        stack = [(self, False)]
+        while stack:
+            v, processed = stack.pop()
+            if processed:
                 topo.append(v)
-
-        build_topo(self)
-
-        for node in reversed(topo):
-            node._backward()
+                continue
+            if id(v) in visited:
+                continue
+            visited.add(id(v))
+            stack.append((v, True))
+            for child in v._children:
+                if id(child) not in visited:
+                    stack.append((child, False))
+        return topo
             
     def size(self):
         return self.data.size
@@ -66,7 +152,7 @@ class Tensor:
         return self.data.item()
     
     def __hash__(self):
-        return self._id
+        return id(self)
 
     def normal_(self, mean=0, std=1):
         self.data = np.random.normal(mean, std, self.shape)
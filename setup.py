@@ -7,6 +7,9 @@ setup(
     install_requires=[
         "numpy>=1.26.4",
     ],
+    extras_require={
+        "numba": ["numba"],
+    },
     author="Dmitry Aspsiov",
     author_email="dmitry.aspisov@gmail.com",
     description="A deep learning library",